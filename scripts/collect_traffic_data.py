@@ -5,12 +5,21 @@ Collects real-time traffic data using TomTom API and weather data using OpenWeat
 """
 
 import os
+import argparse
 import json
-import requests
-import pandas as pd
-from datetime import datetime
+import functools
+import contextlib
+import typing
+from dataclasses import dataclass, fields
+import asyncio
 import time
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlencode
 import pytz
 
 # Configuration
@@ -18,9 +27,49 @@ TOMTOM_API_KEY = os.getenv('TOMTOM_API_KEY')
 OPENWEATHER_API_KEY = os.getenv('OPENWEATHER_API_KEY')
 ROUTES_CONFIG_FILE = 'routes_config.json'
 DATA_DIR = Path('data/raw')
+# Parquet runs live apart from the historical daily CSVs in DATA_DIR
+PARQUET_DIR = DATA_DIR / 'parquet'
+WEATHER_CACHE_FILE = Path('.cache/owm.json')
+
+# Arrow type name for each TrafficRow field type (nullable fields map by their non-None type)
+ARROW_TYPES = {str: 'string', int: 'int64', float: 'float64'}
+
+
+@dataclass(slots=True)
+class TrafficRow:
+    """One collected route observation; field order and types define the Parquet schema, weather columns last"""
+    timestamp: str
+    route_name: str
+    distance_km: float | None
+    duration_minutes: float | None
+    traffic_delay_minutes: float | None
+    status: str
+    route_id: int
+    origin: str
+    destination: str
+    hour: int
+    day_of_week: str
+    is_weekend: int
+    temperature: float | None = None
+    humidity: int | None = None
+    weather_condition: str | None = None
+    rain_1h: float | None = None
+    wind_speed: float | None = None
+
+
+# Traffic columns recorded for a route whose request failed
+FAILED_TRAFFIC_DATA = {
+    'distance_km': None,
+    'duration_minutes': None,
+    'traffic_delay_minutes': None,
+    'status': 'failed'
+}
+
+# Weather changes on ~10 minute scales; reuse a cached payload this fresh without asking
+WEATHER_CACHE_MAX_AGE = 300
 
 # API endpoints
-TOMTOM_BASE_URL = "https://api.tomtom.com/routing/1/calculateRoute"
+TOMTOM_BATCH_URL = "https://api.tomtom.com/routing/1/batch/sync/json"
 OPENWEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
 
 # Bangalore coordinates for weather
@@ -30,15 +79,131 @@ BANGALORE_LON = 77.5946
 # IST timezone
 IST = pytz.timezone('Asia/Kolkata')
 
+# Per-request timeout for the weather API; a synchronous batch may take up to 60s server-side
+REQUEST_TIMEOUT = 10.0
+BATCH_TIMEOUT = 60.0
 
-def load_routes():
-    """Load routes from configuration file"""
+# All routes go out in synchronous batches of at most TOMTOM_BATCH_MAX_ITEMS queries
+TOMTOM_BATCH_MAX_ITEMS = 100
+TOMTOM_ROUTE_PARAMS = {
+    'traffic': 'true',
+    'travelMode': 'car',
+    'departAt': 'now',
+    # Only the summary is consumed; skip route geometry (guidance is omitted by default)
+    'routeRepresentation': 'summaryOnly'
+}
+
+# Connection pool shared by all calls in a run; HTTP/2 multiplexes concurrent
+# requests to the same host over a single TLS connection
+POOL_MAXSIZE = 16
+CLIENT_HEADERS = {'Accept-Encoding': 'gzip'}
+
+# Client-side token bucket for TomTom batch calls: holds up to TOMTOM_MAX_RATE tokens,
+# refilled at TOMTOM_MAX_RATE per second. Bursts up to capacity go out at once, after
+# that each call waits for a token. Tune to the QPS of the TomTom plan.
+TOMTOM_MAX_RATE = 5
+TOMTOM_LIMITER = AsyncLimiter(max_rate=TOMTOM_MAX_RATE, time_period=1)
+
+# Retry backoff: base * 2**attempt plus up to RETRY_JITTER seconds, capped at RETRY_MAX_DELAY
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_JITTER = 0.5
+RETRY_MAX_DELAY = 30.0
+
+
+@functools.lru_cache(maxsize=1)
+def _load_routes_cached(mtime):
+    """Parse the routes config; cached per file modification time"""
     with open(ROUTES_CONFIG_FILE, 'r') as f:
         config = json.load(f)
     return config['routes']
 
 
-def get_weather_data():
+def load_routes():
+    """Load routes from configuration file, re-parsing only when it has changed"""
+    return _load_routes_cached(os.path.getmtime(ROUTES_CONFIG_FILE))
+
+
+class RateLimitedError(Exception):
+    """TomTom answered 429; retry_after holds the Retry-After delay in seconds, if any"""
+    
+    def __init__(self, retry_after=None):
+        super().__init__("rate limit hit")
+        self.retry_after = retry_after
+
+
+class ServerError(Exception):
+    """TomTom answered with a 5xx status; worth retrying"""
+
+
+class UnrecoverableError(Exception):
+    """TomTom answered with a 4xx status other than 429 (400/401/403 ...); retrying will not help"""
+
+
+def parse_retry_after(value):
+    """Seconds from a numeric Retry-After header, or None if missing or not a positive number"""
+    try:
+        seconds = int(value) if value else 0
+    except ValueError:
+        return None
+    return seconds if seconds > 0 else None
+
+
+_wait_backoff = wait_exponential_jitter(initial=RETRY_BASE_DELAY, max=RETRY_MAX_DELAY, jitter=RETRY_JITTER)
+
+
+def wait_retry_after(retry_state):
+    """Honour Retry-After on 429, otherwise back off exponentially with jitter"""
+    error = retry_state.outcome.exception()
+    if isinstance(error, RateLimitedError) and error.retry_after:
+        return error.retry_after
+    return _wait_backoff(retry_state)
+
+
+def log_retry(retry_state):
+    """Report a failed attempt before tenacity sleeps"""
+    error = retry_state.outcome.exception()
+    print(f"⚠️  Request failed (attempt {retry_state.attempt_number}/{RETRY_MAX_ATTEMPTS}): {str(error)}")
+    print(f"   ⏳ Retrying in {retry_state.next_action.sleep:.1f} seconds...")
+
+
+def load_weather_cache():
+    """Load the last weather payload and its validators, or None if there is no usable cache"""
+    try:
+        with open(WEATHER_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_weather_cache(data, etag=None, last_modified=None):
+    """Persist the weather payload together with its ETag / Last-Modified validators"""
+    cache = {
+        'fetched_at': time.time(),
+        'etag': etag,
+        'last_modified': last_modified,
+        'body': data
+    }
+    try:
+        WEATHER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(WEATHER_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"⚠️  Could not write weather cache: {str(e)}")
+
+
+def parse_weather(data):
+    """Extract the weather columns from an OpenWeatherMap response"""
+    return {
+        'temperature': round(data['main']['temp'], 1),
+        'humidity': data['main']['humidity'],
+        'weather_condition': data['weather'][0]['main'],
+        'rain_1h': data.get('rain', {}).get('1h', 0),
+        'wind_speed': round(data['wind']['speed'], 1)
+    }
+
+
+async def get_weather_data(client):
     """Fetch current weather data for Bangalore"""
     
     if not OPENWEATHER_API_KEY:
@@ -59,18 +224,33 @@ def get_weather_data():
     }
     
     try:
-        response = requests.get(OPENWEATHER_URL, params=params, timeout=10)
+        cache = load_weather_cache()
+        if cache and time.time() - cache.get('fetched_at', 0) < WEATHER_CACHE_MAX_AGE:
+            weather = parse_weather(cache['body'])
+            print(f"   ♻️  Using cached weather data")
+            return weather
+        
+        # Revalidate the cached payload instead of re-downloading it when unchanged
+        headers = {}
+        if cache and cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache and cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
+        
+        response = await client.get(OPENWEATHER_URL, params=params, headers=headers)
         
         if response.status_code == 200:
-            data = response.json()
-            
-            return {
-                'temperature': round(data['main']['temp'], 1),
-                'humidity': data['main']['humidity'],
-                'weather_condition': data['weather'][0]['main'],
-                'rain_1h': data.get('rain', {}).get('1h', 0),
-                'wind_speed': round(data['wind']['speed'], 1)
-            }
+            data = orjson.loads(response.content)
+            # Parse before caching so a malformed payload is never persisted
+            weather = parse_weather(data)
+            save_weather_cache(data, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            return weather
+        
+        elif response.status_code == 304:
+            weather = parse_weather(cache['body'])
+            save_weather_cache(cache['body'], cache.get('etag'), cache.get('last_modified'))
+            return weather
+        
         else:
             print(f"⚠️  Weather API error: {response.status_code}")
             return {
@@ -80,7 +260,7 @@ def get_weather_data():
                 'rain_1h': None,
                 'wind_speed': None
             }
-            
+        
     except Exception as e:
         print(f"⚠️  Weather fetch error: {str(e)}")
         return {
@@ -92,64 +272,163 @@ def get_weather_data():
         }
 
 
-def get_traffic_data(origin_lat, origin_lon, dest_lat, dest_lon, api_key, max_retries=3):
+def build_route_query(route):
+    """Build the calculateRoute path + query string for one batch item"""
+    locations = (
+        f"{route['origin']['lat']},{route['origin']['lon']}:"
+        f"{route['destination']['lat']},{route['destination']['lon']}"
+    )
+    return f"/calculateRoute/{locations}/json?{urlencode(TOMTOM_ROUTE_PARAMS)}"
+
+
+def parse_route_summary(data):
+    """Extract the traffic columns from a calculateRoute response, or None if it has no usable route"""
+    if 'routes' in data and len(data['routes']) > 0:
+        try:
+            summary = data['routes'][0]['summary']
+            
+            return {
+                'distance_km': round(summary['lengthInMeters'] / 1000, 2),
+                'duration_minutes': round(summary['travelTimeInSeconds'] / 60, 1),
+                'traffic_delay_minutes': round(summary.get('trafficDelayInSeconds', 0) / 60, 1),
+                'status': 'success'
+            }
+        except (KeyError, IndexError, TypeError) as e:
+            print(f"⚠️  Malformed route data in response: {str(e)}")
+            return None
+    
+    print(f"⚠️  No route data in response")
+    return None
+
+
+@retry(
+    stop=stop_after_attempt(RETRY_MAX_ATTEMPTS),
+    wait=wait_retry_after,
+    retry=retry_if_exception_type((httpx.TransportError, RateLimitedError, ServerError)),
+    before_sleep=log_retry,
+    reraise=True
+)
+async def send_batch(client, payload, api_key):
     """
-    Fetch traffic data from TomTom API with retry logic
+    Submit one synchronous batch to the TomTom Batch Routing API.
+    Returns the list of batch item results (in request order); raises on a non-200 answer.
     """
-    route = f"{origin_lat},{origin_lon}:{dest_lat},{dest_lon}"
+    async with TOMTOM_LIMITER:
+        response = await client.post(
+            TOMTOM_BATCH_URL, params={'key': api_key}, content=payload,
+            headers={'Content-Type': 'application/json'}, timeout=BATCH_TIMEOUT
+        )
     
-    params = {
-        'key': api_key,
-        'traffic': 'true',
-        'travelMode': 'car',
-        'departAt': 'now'
-    }
+    if response.status_code == 200:
+        # A 200 with an unparseable body (e.g. an HTML gateway page) is treated as transient
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            raise ServerError("API returned a non-JSON body")
+        batch_items = data.get('batchItems') if isinstance(data, dict) else None
+        if not isinstance(batch_items, list):
+            raise ServerError("API response has no batchItems list")
+        return batch_items
+    elif response.status_code == 429:
+        raise RateLimitedError(parse_retry_after(response.headers.get('Retry-After')))
+    elif response.status_code >= 500:
+        raise ServerError(f"API error: {response.status_code}")
+    else:
+        raise UnrecoverableError(f"API error: {response.status_code}")
+
+
+async def post_batch(client, batch_items, api_key):
+    """
+    Submit one batch with retry logic.
+    Returns the list of batch item results (in request order), or None on failure.
+    """
+    payload = orjson.dumps({'batchItems': batch_items})
     
-    url = f"{TOMTOM_BASE_URL}/{route}/json"
+    try:
+        return await send_batch(client, payload, api_key)
+    except (httpx.TransportError, RateLimitedError, ServerError) as e:
+        # Same exception types send_batch retries on
+        print(f"⚠️  Batch request failed after {RETRY_MAX_ATTEMPTS} attempts: {str(e)}")
+    except (UnrecoverableError, httpx.HTTPError) as e:
+        print(f"⚠️  {str(e)}, not retrying")
     
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if 'routes' in data and len(data['routes']) > 0:
-                    route_info = data['routes'][0]
-                    summary = route_info['summary']
-                    
-                    return {
-                        'distance_km': round(summary['lengthInMeters'] / 1000, 2),
-                        'duration_minutes': round(summary['travelTimeInSeconds'] / 60, 1),
-                        'traffic_delay_minutes': round(summary.get('trafficDelayInSeconds', 0) / 60, 1),
-                        'status': 'success'
-                    }
-                else:
-                    print(f"⚠️  No route data in response")
-                    return None
-                    
-            elif response.status_code == 429:
-                print(f"⚠️  Rate limit hit, waiting 60 seconds...")
-                time.sleep(60)
-                continue
-                
-            else:
-                print(f"⚠️  API error: {response.status_code}")
-                if attempt < max_retries - 1:
-                    time.sleep(5)
-                continue
-                
-        except requests.exceptions.RequestException as e:
-            print(f"⚠️  Request failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
-            if attempt < max_retries - 1:
-                time.sleep(5)
+    return None
+
+
+async def get_traffic_data(client, routes, api_key):
+    """
+    Fetch traffic data for all routes via TomTom batch requests.
+    Returns one result per route (same order); None where the route failed.
+    """
+    chunks = [
+        routes[i:i + TOMTOM_BATCH_MAX_ITEMS]
+        for i in range(0, len(routes), TOMTOM_BATCH_MAX_ITEMS)
+    ]
+    batch_results = await asyncio.gather(*(
+        post_batch(client, [{'query': build_route_query(route)} for route in chunk], api_key)
+        for chunk in chunks
+    ))
+    
+    results = []
+    for chunk, batch_items in zip(chunks, batch_results):
+        if batch_items is None or len(batch_items) != len(chunk):
+            results.extend([None] * len(chunk))
             continue
+        
+        for route, item in zip(chunk, batch_items):
+            # A malformed item only fails its own route
+            if not isinstance(item, dict):
+                item = {}
+            response = item.get('response')
+            if not isinstance(response, dict):
+                response = {}
+            if item.get('statusCode') == 200:
+                results.append(parse_route_summary(response))
+            else:
+                error = (response.get('error') or {}).get('description', '')
+                print(f"⚠️  Batch item error for {route['name']}: {item.get('statusCode')} {error}")
+                results.append(None)
     
-    return None
+    return results
 
 
-def collect_all_routes():
-    """Collect traffic data for all routes with weather data"""
+def arrow_base_type(field_type):
+    """Strip None from an optional annotation such as float | None"""
+    non_null = [t for t in typing.get_args(field_type) if t is not type(None)]
+    return non_null[0] if non_null else field_type
+
+
+def write_parquet(rows, parquet_file):
+    """Write TrafficRows to a zstd-compressed Parquet file"""
+    # Imported here so runs that abort early (e.g. missing API key) skip the pyarrow import cost
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    schema = pa.schema([
+        (field.name, getattr(pa, ARROW_TYPES[arrow_base_type(field.type)])())
+        for field in fields(TrafficRow)
+    ])
+    table = pa.Table.from_pydict(
+        {name: [getattr(row, name) for row in rows] for name in schema.names},
+        schema=schema
+    )
+    pq.write_table(table, parquet_file, compression='zstd')
+
+
+def print_table(rows, columns):
+    """Print the given columns of rows as a right-aligned plain-text table"""
+    cells = [[str(column) for column in columns]]
+    cells += [['' if getattr(row, column) is None else str(getattr(row, column)) for column in columns] for row in rows]
+    widths = [max(len(line[i]) for line in cells) for i in range(len(columns))]
+    for line in cells:
+        print(' '.join(cell.rjust(width) for cell, width in zip(line, widths)))
+
+
+async def collect_all_routes(include_weather=True):
+    """
+    Collect traffic data for all routes, with weather data unless include_weather is False.
+    Without weather the weather columns are still written (as nulls) so every file shares one schema.
+    """
     
     if not TOMTOM_API_KEY:
         print("❌ ERROR: TOMTOM_API_KEY environment variable not set!")
@@ -160,112 +439,98 @@ def collect_all_routes():
     
     print(f"🚗 Starting traffic data collection at {now_ist.strftime('%Y-%m-%d %H:%M:%S IST')}")
     
-    # Get weather data once (same for all routes)
-    print(f"🌤️  Fetching weather data...")
-    weather_data = get_weather_data()
-    if weather_data['temperature'] is not None:
-        print(f"   ✅ Weather: {weather_data['temperature']}°C, {weather_data['weather_condition']}, {weather_data['humidity']}% humidity")
-    else:
-        print(f"   ⚠️  Weather data unavailable")
-    
-    routes = load_routes()
-    print(f"📍 Loaded {len(routes)} routes")
-    
     timestamp_str = now_ist.strftime('%Y-%m-%d %H:%M:%S')
     date_str = now_ist.strftime('%Y%m%d')
+    hour = now_ist.hour
+    day_of_week = now_ist.strftime('%A')
+    is_weekend = int(now_ist.weekday() >= 5)
+    
+    limits = httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_MAXSIZE)
+    async with httpx.AsyncClient(http2=True, timeout=REQUEST_TIMEOUT, limits=limits, headers=CLIENT_HEADERS) as client:
+        # Weather (same for all routes) is independent of traffic: start it first and
+        # only wait for it once the route results are in
+        weather_task = None
+        if include_weather:
+            print(f"🌤️  Fetching weather data...")
+            weather_task = asyncio.create_task(get_weather_data(client))
+        
+        try:
+            routes = load_routes()
+            print(f"📍 Loaded {len(routes)} routes")
+            
+            traffic_results = await get_traffic_data(client, routes, TOMTOM_API_KEY)
+            weather_data = await weather_task if include_weather else {}
+        finally:
+            # Don't leave the weather task running against a closing client if traffic failed
+            if weather_task is not None and not weather_task.done():
+                weather_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await weather_task
+    
+    if include_weather:
+        if weather_data['temperature'] is not None:
+            print(f"   ✅ Weather: {weather_data['temperature']}°C, {weather_data['weather_condition']}, {weather_data['humidity']}% humidity")
+        else:
+            print(f"   ⚠️  Weather data unavailable")
     
-    collected_data = []
+    collected_data = [None] * len(routes)
     
-    for route in routes:
+    for i, (route, traffic_data) in enumerate(zip(routes, traffic_results)):
         print(f"\n📊 Collecting data for: {route['name']}")
         
-        traffic_data = get_traffic_data(
-            route['origin']['lat'],
-            route['origin']['lon'],
-            route['destination']['lat'],
-            route['destination']['lon'],
-            TOMTOM_API_KEY
-        )
-        
         if traffic_data:
-            # Combine traffic data with weather data
-            traffic_data.update({
-                'timestamp': timestamp_str,
-                'route_name': route['name'],
-                'route_id': route['id'],
-                'origin': route['origin']['name'],
-                'destination': route['destination']['name'],
-                'hour': now_ist.hour,
-                'day_of_week': now_ist.strftime('%A'),
-                'is_weekend': 1 if now_ist.weekday() >= 5 else 0,
-                # Add weather columns
-                'temperature': weather_data['temperature'],
-                'humidity': weather_data['humidity'],
-                'weather_condition': weather_data['weather_condition'],
-                'rain_1h': weather_data['rain_1h'],
-                'wind_speed': weather_data['wind_speed']
-            })
-            
-            collected_data.append(traffic_data)
             print(f"   ✅ Success: {traffic_data['duration_minutes']} min, {traffic_data['traffic_delay_minutes']} min delay")
         else:
             print(f"   ❌ Failed to collect data")
-            collected_data.append({
-                'timestamp': timestamp_str,
-                'route_name': route['name'],
-                'route_id': route['id'],
-                'origin': route['origin']['name'],
-                'destination': route['destination']['name'],
-                'hour': now_ist.hour,
-                'day_of_week': now_ist.strftime('%A'),
-                'is_weekend': 1 if now_ist.weekday() >= 5 else 0,
-                'distance_km': None,
-                'duration_minutes': None,
-                'traffic_delay_minutes': None,
-                'status': 'failed',
-                # Add weather columns even for failed traffic data
-                'temperature': weather_data['temperature'],
-                'humidity': weather_data['humidity'],
-                'weather_condition': weather_data['weather_condition'],
-                'rain_1h': weather_data['rain_1h'],
-                'wind_speed': weather_data['wind_speed']
-            })
+            traffic_data = FAILED_TRAFFIC_DATA
         
-        time.sleep(1)
+        # Weather columns are added even for failed traffic data
+        collected_data[i] = TrafficRow(
+            timestamp=timestamp_str,
+            route_name=route['name'],
+            route_id=route['id'],
+            origin=route['origin']['name'],
+            destination=route['destination']['name'],
+            hour=hour,
+            day_of_week=day_of_week,
+            is_weekend=is_weekend,
+            **traffic_data,
+            **weather_data
+        )
     
     if collected_data:
-        df = pd.DataFrame(collected_data)
-        
-        # Updated column order with weather data
-        column_order = [
-            'timestamp', 'route_name', 'distance_km', 'duration_minutes', 
-            'traffic_delay_minutes', 'status', 'route_id', 'origin', 
-            'destination', 'hour', 'day_of_week', 'is_weekend',
-            'temperature', 'humidity', 'weather_condition', 'rain_1h', 'wind_speed'
-        ]
-        df = df[column_order]
+        PARQUET_DIR.mkdir(parents=True, exist_ok=True)
         
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        # One compressed file per run; readers load the whole directory with
+        # pyarrow.dataset.dataset(PARQUET_DIR, format='parquet')
+        parquet_file = PARQUET_DIR / f'traffic_data_{date_str}_{int(now_ist.timestamp())}.parquet'
+        write_parquet(collected_data, parquet_file)
+        print(f"\n✅ Data written to: {parquet_file}")
         
-        csv_file = DATA_DIR / f'traffic_data_{date_str}.csv'
-        
-        if csv_file.exists():
-            df.to_csv(csv_file, mode='a', header=False, index=False)
-            print(f"\n✅ Data appended to: {csv_file}")
-        else:
-            df.to_csv(csv_file, index=False)
-            print(f"\n✅ New file created: {csv_file}")
-        
-        success_count = df[df['status'] == 'success'].shape[0]
+        success_count = sum(1 for row in collected_data if row.status == 'success')
         print(f"📈 Summary: {success_count}/{len(routes)} routes collected successfully")
         
         print(f"\n📋 Sample data:")
-        print(df[['route_name', 'duration_minutes', 'traffic_delay_minutes', 'temperature', 'weather_condition']].to_string(index=False))
+        sample_columns = ['route_name', 'duration_minutes', 'traffic_delay_minutes']
+        if include_weather:
+            sample_columns += ['temperature', 'weather_condition']
+        print_table(collected_data, sample_columns)
     else:
         print("\n❌ No data collected")
     
     print(f"\n🏁 Collection completed at {now_ist.strftime('%Y-%m-%d %H:%M:%S IST')}")
 
 
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Collect traffic (and weather) data for Bangalore routes")
+    parser.add_argument(
+        '--no-weather', action='store_true',
+        help="skip the OpenWeatherMap call and leave the weather columns empty"
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    collect_all_routes()
+    args = parse_args()
+    asyncio.run(collect_all_routes(include_weather=not args.no_weather))